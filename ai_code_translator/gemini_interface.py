@@ -179,7 +179,7 @@ class GeminiInterface:
     def chat_response_gui(self, message: str) -> str:
         """Generate a chat response."""
         try:
-            print(f"DEBUG - GeminiInterface.chat_response called with: {message}")
+            logger.debug("GeminiInterface.chat_response called with: %s", message)
             response = self.chat.send_message(
                 message,
                 generation_config={
@@ -189,9 +189,9 @@ class GeminiInterface:
                 }
             )
             
-            print(f"DEBUG - Raw response from Gemini: {response}")
+            logger.debug("Raw response from Gemini: %s", response)
             return response.text
             
         except Exception as e:
-            print(f"DEBUG - Error in GeminiInterface.chat_response: {str(e)}")
+            logger.debug("Error in GeminiInterface.chat_response: %s", e)
             return f"I apologize, but I encountered an error: {str(e)}"
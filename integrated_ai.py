@@ -442,7 +442,7 @@ class IntegratedTranslatorAI:
         Returns:
             Assistant's response
         """
-        print(f"DEBUG - IntegratedTranslatorAI.chat called with message: {message}")
+        logger.debug("IntegratedTranslatorAI.chat called with message: %s", message)
         
         # Add message to conversation history
         if not hasattr(self, 'conversation_history') or self.conversation_history is None:
@@ -453,13 +453,13 @@ class IntegratedTranslatorAI:
         try:
             # Use the chat session directly if available
             if hasattr(self, 'chat_session') and self.chat_session:
-                print("DEBUG - Using self.chat_session directly")
+                logger.debug("Using self.chat_session directly")
                 response = self.chat_session.send_message(message)
                 response_text = response.text
-                print(f"DEBUG - Chat session response: {response_text[:100]}...")
+                logger.debug("Chat session response: %s...", response_text[:100])
             # Fallback to direct model if chat session not available
             elif hasattr(self, 'model') and self.model:
-                print("DEBUG - Using self.model directly")
+                logger.debug("Using self.model directly")
                 response = self.model.generate_content(
                     f"""You are Astutely, a helpful and friendly AI code translation assistant.
                     
@@ -473,12 +473,12 @@ class IntegratedTranslatorAI:
                     }
                 )
                 response_text = response.text
-                print(f"DEBUG - Direct model response: {response_text[:100]}...")
+                logger.debug("Direct model response: %s...", response_text[:100])
             else:
-                print("DEBUG - No model available")
+                logger.debug("No model available")
                 response_text = "I'm sorry, I don't have a language model available to chat with you."
         except Exception as e:
-            print(f"DEBUG - Error in chat: {str(e)}")
+            logger.debug("Error in chat: %s", e)
             response_text = f"I apologize, but I encountered an error: {str(e)}"
         
         # Add response to conversation history
@@ -503,12 +503,12 @@ class IntegratedTranslatorAI:
                     }
                 )
                 response_text = response.text
-                print(f"DEBUG - Direct model response: {response_text[:100]}...")
+                logger.debug("Direct model response: %s...", response_text[:100])
             else:
-                print("DEBUG - No model available")
+                logger.debug("No model available")
                 response_text = "I'm sorry, I don't have a language model available to chat with you."
         except Exception as e:
-            print(f"DEBUG - Error in chat: {str(e)}")
+            logger.debug("Error in chat: %s", e)
             response_text = f"I apologize, but I encountered an error: {str(e)}"
         
         return response_text
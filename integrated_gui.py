@@ -9,20 +9,15 @@ import os
 import sys
 import json
 import logging
-import platform
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace as dataclass_replace
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+from html import escape as html_escape
 import re
-import webbrowser
 import time
-import subprocess
 import traceback
 import argparse
-import pathlib
 from pathlib import Path
-import pygments
-import jsonschema
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
@@ -33,8 +28,6 @@ import asyncio
 # AI imports
 from integrated_ai import IntegratedTranslatorAI
 from ai_code_translator.chatbot_interface import ChatbotInterface
-from security.vulnerability_scanner import VulnerabilityScanner
-from security.vulnerability_scanner_interface import VulnerabilityScannerInterface
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +36,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for settings I/O when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
+# Settings file location
+_CONFIG_DIR = Path(__file__).resolve().parent / "config"
+_SETTINGS_PATH = _CONFIG_DIR / "settings.json"
+
+# Fenced code blocks in AI fix recommendations
+_CODE_BLOCK_RE = re.compile(r'```(?:\w+)?\n(.*?)```', re.DOTALL)
+
+# Choices offered in the settings dialog
+_HIGHLIGHT_STYLES = ("default", "monokai", "vs", "solarized-dark", "solarized-light")
+_GEMINI_MODELS = ("models/gemini-1.5-pro-001",)
+
+# Entry "show" option for the API key, indexed by whether it is revealed
+_API_KEY_MASK = ("*", "")
+
 # Theme settings
 THEMES = {
     "Dark": "darkly",
@@ -50,6 +70,178 @@ THEMES = {
     "Classic": "default"
 }
 
+# Example vulnerable code shown by the scanner's "Load Example" button
+_EXAMPLE_CODE = {
+    "Python": """\
+def read_file(filename):
+    with open(filename, 'r') as f:
+        return f.read()
+
+def main():
+    data = read_file('secret.txt')
+    print(f"Secret data: {data}")
+
+if __name__ == "__main__":
+    main()
+""",
+    "JavaScript": """\
+function login(username, password) {
+    if (username === "admin" && password === "admin123") {
+        return true;
+    }
+    return false;
+}
+""",
+    "Java": """\
+import java.io.FileInputStream;
+import java.io.IOException;
+
+public class FileReader {
+    public static void main(String[] args) {
+        try {
+            FileInputStream fis = new FileInputStream("secret.txt");
+            int content;
+            while ((content = fis.read()) != -1) {
+                System.out.print((char) content);
+            }
+            fis.close();
+        } catch (IOException e) {
+            System.out.println("Error reading file");
+        }
+    }
+}
+""",
+    "C++": """\
+#include <iostream>
+#include <fstream>
+
+int main() {
+    std::ifstream file("secret.txt");
+    std::string line;
+    while (getline(file, line)) {
+        std::cout << line << std::endl;
+    }
+    return 0;
+}
+""",
+    "C#": """\
+using System;
+using System.IO;
+
+class Program {
+    static void Main() {
+        string path = "secret.txt";
+        string content = File.ReadAllText(path);
+        Console.WriteLine(content);
+    }
+}
+""",
+    "Go": """\
+package main
+
+import (
+    "fmt"
+    "os"
+)
+
+func main() {
+    data, err := os.ReadFile("secret.txt")
+    if err != nil {
+        fmt.Println("Error reading file")
+        return
+    }
+    fmt.Println(string(data))
+}
+""",
+    "Ruby": """\
+def read_secret
+    file = File.open("secret.txt")
+    secret = file.read
+    puts secret
+end
+
+read_secret
+""",
+    "PHP": """\
+<?php
+$filename = 'secret.txt';
+$content = file_get_contents($filename);
+echo $content;
+?>
+""",
+    "Swift": """\
+import Foundation
+
+let path = "secret.txt"
+do {
+    let content = try String(contentsOfFile: path)
+    print(content)
+} catch {
+    print("Error reading file")
+}
+""",
+    "Kotlin": """\
+fun main() {
+    val path = "secret.txt"
+    val content = File(path).readText()
+    println(content)
+}
+""",
+}
+_DEFAULT_EXAMPLE = "// Example vulnerable code in selected language\n"
+
+class _DemoAI:
+    """Stand-in AI interface used when running in demo mode."""
+
+    def translate_code(self, source_code, source_lang=None, target_lang=None, **_):
+        """Return the source code unchanged with a demo-mode banner."""
+        return f"// Translated to {target_lang}\n// DEMO MODE - NO ACTUAL TRANSLATION\n\n{source_code}"
+
+    def chat(self, message):
+        """Return a fixed demo-mode reply."""
+        return "This is demo mode. Please enter a valid API key for full functionality."
+
+    def scan_vulnerabilities(self, code, language):
+        """Return a single placeholder finding."""
+        return {
+            'vulnerabilities': [
+                {
+                    'severity': 'high',
+                    'type': 'Demo Vulnerability',
+                    'description': 'This is a demo vulnerability for testing purposes.',
+                    'line': 1,
+                    'fix': 'This is demo mode. Please enter a valid API key for actual vulnerability scanning.'
+                }
+            ],
+            'summary': 'Demo scan completed. Please enter a valid API key for actual vulnerability scanning.'
+        }
+
+# Seconds a successful API test is trusted before the key and model are probed again
+_PROBE_TTL = 30.0
+
+# (api_key, model) -> time.monotonic() of its last successful probe
+_probe_successes = {}
+
+def _probe_api(api_key, model):
+    """Send a test prompt with the given key and model, unless one succeeded within _PROBE_TTL."""
+    checked_at = _probe_successes.get((api_key, model))
+    if checked_at is not None and time.monotonic() - checked_at < _PROBE_TTL:
+        return True
+    from ai_code_translator.gemini_interface import GeminiInterface
+    temp_gemini = GeminiInterface(api_key=api_key, model=model)
+    if not temp_gemini.generate("Hello, how are you?"):
+        raise Exception("No response from API")
+    _probe_successes[(api_key, model)] = time.monotonic()
+    return True
+
+def _chunked_insert(widget, text, chunk=4096, start=0):
+    """Insert text into a Text widget a chunk at a time, yielding to Tk between chunks."""
+    if not widget.winfo_exists():
+        return
+    widget.insert(tk.END, text[start:start + chunk])
+    if start + chunk < len(text):
+        widget.after_idle(_chunked_insert, widget, text, chunk, start + chunk)
+
 class IntegratedTranslatorGUI:
     """Main GUI class for the AI Code Translator."""
 
@@ -62,6 +254,7 @@ class IntegratedTranslatorGUI:
         """Handle theme changes."""
         new_theme = self.theme_var.get()
         self.style.theme_use(THEMES[new_theme])
+        self._theme_cursor = self._theme_positions.get(THEMES[new_theme], self._theme_cursor)
         self.current_theme = new_theme
         self.theme_indicator.config(text=f"Theme: {new_theme}")
 
@@ -81,26 +274,72 @@ class IntegratedTranslatorGUI:
             # Initialize variables
             self.font_size = 10  # Default font size
             self.current_theme = "Dark"  # Default theme
+            
+            # Themes cycled through by _change_theme, and the position of the active one
+            self._theme_cycle = list(self.style.theme_names())
+            self._theme_positions = {name: i for i, name in enumerate(self._theme_cycle)}
+            self._theme_cursor = self._theme_positions.get(self.style.theme_use(), 0)
+            
+            # Wrap mode of the editors; Text widgets start out wrapping by character
+            self._current_wrap_mode = tk.CHAR
             self.gemini_api_key = gemini_api_key
             self.gemini_model = gemini_model  # Initialize model variable early
             self.enable_premium = enable_premium
             self.enable_security = enable_security
             self.current_file = None
             
+            # Background pool for file I/O that should not block the UI
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="io")
+            
+            # Chat requests run one at a time, in order, since the chat session keeps history
+            self._chat_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat")
+            
+            # Long-lived asyncio loop for scans, driven from the Tk event loop
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self.root.after(10, self._tick_asyncio)
+            
             # Initialize theme variable
             self.theme_var = tk.StringVar(value=self.current_theme)
             
-            # Initialize AI components
-            self.ai_interface = IntegratedTranslatorAI(
+            # Initialize AI components while the widgets are being built
+            init_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="init")
+            ai_future = init_pool.submit(
+                IntegratedTranslatorAI,
                 credentials_path="config/gemini_credentials_template.json",
                 model_name=gemini_model
             )
+            init_pool.shutdown(wait=False)
+            
+            # The vulnerability scanner is created on the first scan
+            self.vulnerability_scanner = None
+            self.vulnerability_scanner_interface = None
             
             # Initialize language settings
             self.source_lang = "Python"
             self.target_lang = "JavaScript"
             self.scan_lang = "Python"
             
+            # Code and language of the last scan, reused when generating fixes
+            self._last_scanned_code = None
+            self._last_scanned_language = None
+            
+            # Findings streamed by the scan in progress
+            self._scan_findings = []
+            
+            # (code, language, findings) of the last scan that completed, so
+            # applied fixes only rescan what changed
+            self._completed_scan = None
+            
+            # Task of the scan currently running, if any
+            self._scan_task = None
+            
+            # after_idle id of a rescan queued by apply_fix, if any
+            self._pending_scan_id = None
+            
+            # after id of the status bar toast currently shown, if any
+            self._toast_id = None
+            
             # Initialize status bar variables
             self.status_var = tk.StringVar(value="Ready")
             
@@ -119,18 +358,8 @@ class IntegratedTranslatorGUI:
             self._create_chatbot_tab()
             self._create_vulnerability_scanner_tab()
             
-            # Initialize vulnerability scanner
-            try:
-                self.vulnerability_scanner = VulnerabilityScanner(
-                    credentials_path="credentials.json"
-                )
-                self.vulnerability_scanner_interface = VulnerabilityScannerInterface(
-                    vulnerability_scanner=self.vulnerability_scanner
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize vulnerability scanner: {e}")
-                self.vulnerability_scanner = None
-                self.vulnerability_scanner_interface = None
+            # Collect the AI interface
+            self.ai_interface = ai_future.result()
             
             # Initialize chatbot
             if self.ai_interface and self.ai_interface.gemini:
@@ -156,6 +385,9 @@ class IntegratedTranslatorGUI:
             
             # Start main loop
             self.root.mainloop()
+            self._io_pool.shutdown(wait=False)
+            self._chat_pool.shutdown(wait=False)
+            self._loop.close()
             
         except Exception as e:
             logger.error(f"Failed to initialize application: {e}")
@@ -164,6 +396,19 @@ class IntegratedTranslatorGUI:
                 self.root.destroy()
             sys.exit(1)
 
+    def _tick_asyncio(self):
+        """Run one pass of ready asyncio callbacks, then reschedule.
+
+        Coroutines therefore run on the Tk thread and may touch widgets
+        directly; blocking work must still go through run_in_executor.
+        Task completion handlers are deferred to Tk with after_idle so
+        any dialog they open does not nest inside the running loop.
+        """
+        if not self._loop.is_running():
+            self._loop.call_soon(self._loop.stop)
+            self._loop.run_forever()
+        self.root.after(10, self._tick_asyncio)
+
     def _add_file_handling_methods(self):
         """Add file handling methods to the class."""
         def open_file(self):
@@ -208,13 +453,11 @@ class IntegratedTranslatorGUI:
                     # Set appropriate tab based on language
                     if file_path.lower().endswith('.py'):
                         self.notebook.select(0)  # Translator tab
-                        self.source_text.delete(1.0, 'end')
-                        self.source_text.insert(1.0, code)
+                        self.source_text.replace(1.0, 'end', code)
                         self.source_lang_var.set('Python')
                     else:
                         self.notebook.select(2)  # Scanner tab
-                        self.scan_text.delete(1.0, 'end')
-                        self.scan_text.insert(1.0, code)
+                        self._replace_scan_code(code)
                         self.scan_lang_var.set(lang_map.get(os.path.splitext(file_path)[1].lower(), 'Python'))
                         
                     self.current_file = file_path
@@ -353,14 +596,21 @@ class IntegratedTranslatorGUI:
 
     def _setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts for the application."""
-        self.root.bind("<Control-n>", lambda e: self.new_file())
-        self.root.bind("<Control-o>", lambda e: self.open_file())
-        self.root.bind("<Control-s>", lambda e: self.save_file())
-        self.root.bind("<Control-t>", lambda e: self.translate_code())
-        self.root.bind("<F1>", lambda e: self._show_about())
-        self.root.bind("<Control-q>", lambda e: self.root.quit())
-        self.root.bind("<Control-plus>", lambda e: self._change_font_size(1))
-        self.root.bind("<Control-minus>", lambda e: self._change_font_size(-1))
+        shortcuts = (
+            ("<Control-n>", lambda e: self.new_file()),
+            ("<Control-o>", lambda e: self.open_file()),
+            ("<Control-s>", lambda e: self.save_file()),
+            ("<Control-t>", lambda e: self.translate_code()),
+            ("<F1>", lambda e: self._show_about()),
+            ("<Control-q>", lambda e: self.root.quit()),
+            ("<Control-plus>", lambda e: self._change_font_size(1)),
+            ("<Control-minus>", lambda e: self._change_font_size(-1)),
+        )
+        for sequence, handler in shortcuts:
+            self.root.bind(sequence, handler)
+        
+        # Enter in any chat entry sends the message; bound once per class
+        self.root.bind_class('ChatEntry', '<Return>', self.send_message)
         
     def prompt_for_api_key(self):
         """Prompt the user for their API key."""
@@ -424,23 +674,7 @@ class IntegratedTranslatorGUI:
         
     def _mock_ai_interface(self):
         """Create a mock AI interface for demo purposes."""
-        self.ai_interface = type('MockAI', (), {
-            'translate_code': lambda source_code, target_language, use_neural=False, use_llm=False: 
-                f"// Translated to {target_language}\n// DEMO MODE - NO ACTUAL TRANSLATION\n\n{source_code}",
-            'chat': lambda message: "This is demo mode. Please enter a valid API key for full functionality.",
-            'scan_vulnerabilities': lambda code, language: {
-                'vulnerabilities': [
-                    {
-                        'severity': 'high',
-                        'type': 'Demo Vulnerability',
-                        'description': 'This is a demo vulnerability for testing purposes.',
-                        'line': 1,
-                        'fix': 'This is demo mode. Please enter a valid API key for actual vulnerability scanning.'
-                    }
-                ],
-                'summary': 'Demo scan completed. Please enter a valid API key for actual vulnerability scanning.'
-            }
-        })()
+        self.ai_interface = _DemoAI()
         
     def _save_api_key(self, api_key: str, dialog: tb.Toplevel):
         """Save the API key and initialize AI."""
@@ -470,6 +704,18 @@ class IntegratedTranslatorGUI:
         mb = tk.messagebox
         mb.showerror("Error", message)
 
+    def _toast(self, message, ms=3000):
+        """Show a transient message in the status bar, then return to "Ready"."""
+        if self._toast_id is not None:
+            self.root.after_cancel(self._toast_id)
+        self.status_var.set(message)
+        self._toast_id = self.root.after(ms, self._clear_toast)
+
+    def _clear_toast(self):
+        """Reset the status bar after a toast."""
+        self._toast_id = None
+        self.status_var.set("Ready")
+
     def _setup_translator_tab(self):
         """Set up the translator tab UI"""
         main_frame = tb.Frame(self.translator_tab)
@@ -675,9 +921,8 @@ class IntegratedTranslatorGUI:
                     target_lang=target_lang
                 )
                 
-                # Update target text
-                self.target_text.delete(1.0, tk.END)
-                self.target_text.insert(tk.END, translated_code)
+                # Update target text in a single Tcl call
+                self.target_text.replace(1.0, tk.END, translated_code)
                 
             finally:
                 # Re-enable widgets
@@ -711,8 +956,8 @@ class IntegratedTranslatorGUI:
         self.send_button = tb.Button(message_frame, text="Send", command=self.send_message)
         self.send_button.pack(side=LEFT, padx=5)
         
-        # Bind Enter key to send message
-        self.message_entry.bind('<Return>', self.send_message)
+        # Route Enter through the shared ChatEntry binding
+        self.message_entry.bindtags(('ChatEntry',) + self.message_entry.bindtags())
 
     def _create_chatbot_tab(self):
         """Create the chatbot tab with text widget."""
@@ -744,8 +989,8 @@ class IntegratedTranslatorGUI:
         )
         self.send_button.pack(side=LEFT, padx=5)
         
-        # Bind Enter key to send message
-        self.message_entry.bind('<Return>', self.send_message)
+        # Route Enter through the shared ChatEntry binding
+        self.message_entry.bindtags(('ChatEntry',) + self.message_entry.bindtags())
 
     def send_message(self, event=None):
         """Handle sending a message to the chatbot."""
@@ -764,9 +1009,14 @@ class IntegratedTranslatorGUI:
         self.chat_text.insert(tk.END, f"You: {message}\n\n")
         self.chat_text.configure(state='disabled')
         
+        # Get the response off the Tk thread so the entry stays usable
+        future = self._loop.run_in_executor(self._chat_pool, self.chatbot.send_message, message)
+        future.add_done_callback(lambda f: self.root.after_idle(self._render_chat_reply, f))
+
+    def _render_chat_reply(self, future):
+        """Add the chatbot's response to the chat, or report the error."""
         try:
-            # Get response from chatbot
-            response = self.chatbot.send_message(message)
+            response = future.result()
             
             # Add chatbot response
             self.chat_text.configure(state='normal')
@@ -779,64 +1029,147 @@ class IntegratedTranslatorGUI:
         except Exception as e:
             self._show_error(f"Error sending message: {str(e)}")
 
-    async def scan_code_for_vulnerabilities(self):
-        """Scan code for security vulnerabilities."""
-        print("DEBUG: scan_code_for_vulnerabilities called") # DEBUG
-        if not self.vulnerability_scanner_interface:
-            self._show_error("Vulnerability scanner is not initialized")
-            print("DEBUG: Scanner not initialized, returning") # DEBUG
+    def _on_scan_button(self):
+        """Start a scan, or cancel the one in progress.
+
+        The cancel lands at the scan's next suspension point, so the button
+        stays disabled until the scan's done handler resets it.
+        """
+        if self._scan_task is not None and not self._scan_task.done():
+            self._scan_task.cancel()
+            self.scan_button.configure(text="Cancelling...", state='disabled')
+        else:
+            self._start_scan()
+
+    def _cancel_scan(self):
+        """Cancel the running scan so a new one can take its place."""
+        if self._scan_task is not None and not self._scan_task.done():
+            self._scan_task.cancel()
+        self._scan_task = None
+
+    def _start_scan(self):
+        """Validate the input and schedule a scan on the asyncio loop."""
+        logger.debug("_start_scan called")
+        code = self.scan_text.get(1.0, tk.END).strip()
+        logger.debug("Code to scan (first 100 chars): %s...", code[:100])
+        if not code:
+            self._show_error("No code to scan")
+            logger.debug("No code to scan, returning")
             return
 
-        try:
-            code = self.scan_text.get(1.0, tk.END).strip()
-            print(f"DEBUG: Code to scan (first 100 chars): {code[:100]}...") # DEBUG
-            if not code:
-                self._show_error("No code to scan")
-                print("DEBUG: No code to scan, returning") # DEBUG
-                return
+        # Get the selected language from the dropdown
+        language = self.scan_lang_var.get()
+        logger.debug("Selected language: %s", language)
+        self._last_scanned_code = code
+        self._last_scanned_language = language
+        self._scan_findings = []
 
-            print("DEBUG: Disabling widgets") # DEBUG
-            self.scan_button.configure(state=tb.DISABLED)
-            self.scan_text.configure(state='disabled')
-            self.scan_results.configure(state='normal')
-            self.scan_results.delete(1.0, tk.END)
-            self.scan_results.insert(tk.END, "Scanning code...\n")
-            self.scan_results.configure(state='disabled')
-            self.root.update_idletasks() # Force GUI update
-            
+        self._cancel_scan()
+        logger.debug("Disabling widgets")
+        self.scan_button.configure(text="Cancel Scan", state='normal')
+        self.scan_text.configure(state='disabled')
+        self._set_scan_results("Scanning code...\n")
+
+        self._scan_task = self._loop.create_task(self.scan_code_for_vulnerabilities(code, language))
+        self._scan_task.add_done_callback(lambda t: self.root.after_idle(self._on_scan_done, t))
+
+    async def scan_code_for_vulnerabilities(self, code, language):
+        """Scan code for security vulnerabilities.
+
+        Runs on the asyncio loop ticked from Tk, so findings are added to
+        the results as soon as the scanner yields them.
+        """
+        logger.debug("scan_code_for_vulnerabilities called")
+        scanner = await self._ensure_scanner()
+        logger.debug("Calling vulnerability_scanner_interface.scan_code_stream")
+        count = 0
+        async for finding in scanner.scan_code_stream(code, language):
+            logger.debug("Finding received: %s", finding)
+            count += 1
+            self._append_finding(finding)
+        return count
+
+    async def _ensure_scanner(self):
+        """Return the scanner interface, creating it on first use.
+
+        Reuses the scanner IntegratedTranslatorAI already built at startup,
+        and only constructs one here when the AI interface has none (demo
+        mode, or its scanner failed to initialize).
+        """
+        if self.vulnerability_scanner_interface is None:
+            shared = getattr(self.ai_interface, 'vulnerability_scanner_interface', None)
+            if shared is not None:
+                self.vulnerability_scanner = self.ai_interface.vulnerability_scanner
+                self.vulnerability_scanner_interface = shared
+                return shared
+            loop = asyncio.get_running_loop()
             try:
-                # Get the selected language from the dropdown
-                language = self.scan_lang_var.get()
-                print(f"DEBUG: Selected language: {language}") # DEBUG
-                
-                # Scan the code
-                print("DEBUG: Calling vulnerability_scanner_interface.scan_code") # DEBUG
-                results = await self.vulnerability_scanner_interface.scan_code(code, language)
-                print(f"DEBUG: Scan results received: {results}") # DEBUG
-                
-                # Show results
-                print("DEBUG: Updating results widget") # DEBUG
-                self.scan_results.configure(state='normal')
-                self.scan_results.delete(1.0, tk.END)
-                self.scan_results.insert(tk.END, results if results else "No vulnerabilities found or scanner returned empty.")
-                self.scan_results.configure(state='disabled')
-                print("DEBUG: Results widget updated") # DEBUG
-                
-            finally:
-                # Re-enable widgets
-                print("DEBUG: Re-enabling widgets in finally block") # DEBUG
-                self.scan_button.configure(state=tb.NORMAL)
-                self.scan_text.configure(state='normal')
+                self.vulnerability_scanner_interface = await loop.run_in_executor(None, self._create_scanner)
+            except Exception as e:
+                logger.error(f"Failed to initialize vulnerability scanner: {e}")
+                raise
+        return self.vulnerability_scanner_interface
 
+    def _create_scanner(self):
+        """Construct a vulnerability scanner for the GUI's own use."""
+        from security.vulnerability_scanner import VulnerabilityScanner
+        from security.vulnerability_scanner_interface import VulnerabilityScannerInterface
+        
+        self.vulnerability_scanner = VulnerabilityScanner(
+            credentials_path="credentials.json"
+        )
+        return VulnerabilityScannerInterface(
+            vulnerability_scanner=self.vulnerability_scanner
+        )
+
+    def _append_scan_results(self, text):
+        """Append text to the read-only results widget."""
+        self.scan_results.configure(state='normal')
+        self.scan_results.insert(tk.END, text)
+        self.scan_results.configure(state='disabled')
+        self.scan_results.see(tk.END)
+
+    def _set_scan_results(self, text):
+        """Replace the contents of the read-only results widget in one edit."""
+        self.scan_results.configure(state='normal')
+        self.scan_results.replace(1.0, tk.END, text)
+        self.scan_results.configure(state='disabled')
+
+    def _format_finding(self, finding):
+        """Format a finding as one line of the results widget."""
+        return f"Line {finding.line_number} [{finding.severity.value}] {finding.category}: {finding.description}\n"
+
+    def _append_finding(self, finding):
+        """Append a single streamed finding to the results widget."""
+        self._scan_findings.append(finding)
+        self._append_scan_results(self._format_finding(finding))
+
+    def _on_scan_done(self, future):
+        """Report scan errors and re-enable the scan widgets."""
+        if future is not self._scan_task:
+            # Superseded by a newer scan, which now owns the widgets
+            return
+        self._scan_task = None
+        try:
+            count = future.result()
+            self._completed_scan = (self._last_scanned_code, self._last_scanned_language, list(self._scan_findings))
+            if count:
+                self._append_scan_results(f"\nScan complete: {count} vulnerabilities found.\n")
+            else:
+                self._append_scan_results("No vulnerabilities found or scanner returned empty.\n")
+        except asyncio.CancelledError:
+            self._append_scan_results("\nScan cancelled.\n")
         except Exception as e:
-            print(f"DEBUG: Exception caught: {e}") # DEBUG
+            logger.debug("Exception caught: %s", e)
             self._show_error(f"Error scanning code: {str(e)}")
-            # Ensure widgets are re-enabled even on error
+        finally:
+            # Re-enable widgets
+            logger.debug("Re-enabling widgets")
             try:
-                 self.scan_button.configure(state=tb.NORMAL)
-                 self.scan_text.configure(state='normal')
+                self.scan_button.configure(text="Scan Code", state='normal')
+                self.scan_text.configure(state='normal')
             except tk.TclError:
-                 print("DEBUG: Widgets might already be destroyed on error exit")
+                logger.debug("Widgets might already be destroyed on error exit")
 
     def _create_vulnerability_scanner_tab(self):
         """Create the vulnerability scanner tab with text widget."""
@@ -894,7 +1227,7 @@ class IntegratedTranslatorGUI:
         self.scan_button = tb.Button(
             button_frame,
             text="Scan Code",
-            command=lambda: asyncio.run(self.scan_code_for_vulnerabilities()),
+            command=self._on_scan_button,
             bootstyle="primary"
         )
         self.scan_button.pack(side=LEFT, padx=5)
@@ -911,144 +1244,22 @@ class IntegratedTranslatorGUI:
     def load_example_code(self, language="Python"):
         """Load example vulnerable code for demonstration."""
         try:
-            example_code = """
-            // Example vulnerable code in selected language
-            """
-            
-            if language == "Python":
-                example_code = """
-                def read_file(filename):
-                    with open(filename, 'r') as f:
-                        return f.read()
-                
-                def main():
-                    data = read_file('secret.txt')
-                    print(f"Secret data: {data}")
-                
-                if __name__ == "__main__":
-                    main()
-                """
-            elif language == "JavaScript":
-                example_code = """
-                function login(username, password) {
-                    if (username === "admin" && password === "admin123") {
-                        return true;
-                    }
-                    return false;
-                }
-                """
-            elif language == "Java":
-                example_code = """
-                import java.io.FileInputStream;
-                import java.io.IOException;
-                
-                public class FileReader {
-                    public static void main(String[] args) {
-                        try {
-                            FileInputStream fis = new FileInputStream("secret.txt");
-                            int content;
-                            while ((content = fis.read()) != -1) {
-                                System.out.print((char) content);
-                            }
-                            fis.close();
-                        } catch (IOException e) {
-                            System.out.println("Error reading file");
-                        }
-                    }
-                }
-                """
-            elif language == "C++":
-                example_code = """
-                #include <iostream>
-                #include <fstream>
-                
-                int main() {
-                    std::ifstream file("secret.txt");
-                    std::string line;
-                    while (getline(file, line)) {
-                        std::cout << line << std::endl;
-                    }
-                    return 0;
-                }
-                """
-            elif language == "C#":
-                example_code = """
-                using System;
-                using System.IO;
-                
-                class Program {
-                    static void Main() {
-                        string path = "secret.txt";
-                        string content = File.ReadAllText(path);
-                        Console.WriteLine(content);
-                    }
-                }
-                """
-            elif language == "Go":
-                example_code = """
-                package main
-                
-                import (
-                    "fmt"
-                    "os"
-                )
-                
-                func main() {
-                    data, err := os.ReadFile("secret.txt")
-                    if err != nil {
-                        fmt.Println("Error reading file")
-                        return
-                    }
-                    fmt.Println(string(data))
-                }
-                """
-            elif language == "Ruby":
-                example_code = """
-                def read_secret
-                    file = File.open("secret.txt")
-                    secret = file.read
-                    puts secret
-                end
-                
-                read_secret
-                """
-            elif language == "PHP":
-                example_code = """
-                <?php
-                $filename = 'secret.txt';
-                $content = file_get_contents($filename);
-                echo $content;
-                ?>
-                """
-            elif language == "Swift":
-                example_code = """
-                import Foundation
-                
-                let path = "secret.txt"
-                do {
-                    let content = try String(contentsOfFile: path)
-                    print(content)
-                } catch {
-                    print("Error reading file")
-                }
-                """
-            elif language == "Kotlin":
-                example_code = """
-                fun main() {
-                    val path = "secret.txt"
-                    val content = File(path).readText()
-                    println(content)
-                }
-                """
+            example_code = _EXAMPLE_CODE.get(language, _DEFAULT_EXAMPLE)
             
             self.scan_text.configure(state='normal')
-            self.scan_text.delete(1.0, tk.END)
-            self.scan_text.insert(tk.END, example_code)
+            self._replace_scan_code(example_code)
             self.scan_text.configure(state='disabled')
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load example code: {str(e)}")
 
+    def _replace_scan_code(self, code):
+        """Replace the scan buffer in one edit, without building undo history."""
+        self.scan_text.configure(autoseparators=False)
+        self.scan_text.replace("1.0", tk.END, code)
+        self.scan_text.edit_reset()
+        self.scan_text.configure(autoseparators=True)
+
     def show_vulnerability_details(self):
         """Show details for the selected vulnerability."""
         # Get selected item
@@ -1121,16 +1332,13 @@ class IntegratedTranslatorGUI:
             font=("Helvetica", 11, "bold")
         ).pack(anchor=tk.W, pady=(10, 5))
         
-        # Get the code around the vulnerability
-        code = self.scan_text.get(1.0, 'end').split("\n")
+        # Fetch only the lines around the vulnerability; Tk clamps the range to the buffer
         line_idx = int(line_num) - 1
-        
         start_line = max(0, line_idx - 2)
-        end_line = min(len(code) - 1, line_idx + 2)
+        window = self.scan_text.get(f"{start_line + 1}.0", f"{line_idx + 4}.0").splitlines()
+        end_line = start_line + len(window) - 1
         
-        snippet = "\n".join([
-            f"{i+1}: {line}" for i, line in enumerate(code[start_line:end_line+1], start=start_line)
-        ])
+        snippet = "\n".join(f"{start_line + i + 1}: {line}" for i, line in enumerate(window))
         
         snippet_text = scrolledtext.ScrolledText(
             content_frame,
@@ -1145,19 +1353,10 @@ class IntegratedTranslatorGUI:
         # Highlight the vulnerable line
         snippet_text.tag_configure("highlight", background="#ffe0e0")
         
-        # Calculate line position in the snippet
-        vuln_line_pos = f"{line_idx+1}: "
-        start_pos = snippet.find(vuln_line_pos)
-        if start_pos >= 0:
-            end_pos = snippet.find("\n", start_pos)
-            if end_pos < 0:
-                end_pos = len(snippet)
-            
-            # Convert character positions to Tkinter text positions
-            start_idx = "1.0 + %d chars" % start_pos
-            end_idx = "1.0 + %d chars" % end_pos
-            
-            snippet_text.tag_add("highlight", start_idx, end_idx)
+        # The vulnerable line's position in the snippet maps directly to a Tk line index
+        if start_line <= line_idx <= end_line:
+            highlight_line = line_idx - start_line + 1
+            snippet_text.tag_add("highlight", f"{highlight_line}.0", f"{highlight_line}.end")
         
         snippet_text.configure(state="disabled")
         
@@ -1200,145 +1399,71 @@ class IntegratedTranslatorGUI:
         line_num, severity, category, description = values
         
         # Get the code
-        code = self.scan_text.get(1.0, 'end')
-        language = self.scan_lang
+        code, language = self._code_to_fix()
         
-        # Request fix from AI
-        try:
-            # Set status
-            self.status_var.set("Generating fix recommendation...")
-            # Use the AI to generate a fix
-            if hasattr(self, 'ai_interface') and self.ai_interface:
-                prompt = f"""I have a {language} code with a {severity.lower()} severity vulnerability on line {line_num}. 
-                The issue is: {description}
-                
-                Here's the code:
-                ```{language.lower()}
-                {code}
-                ```
-                
-                Please provide a fixed version of this specific vulnerability, explaining the security issue and showing the corrected code. 
-                Focus only on fixing this one vulnerability.
-                """
-                
-                # Get the fix
-                fix_result = self.ai_interface.ask_question(prompt)
-                
-                # Show the fix dialog
-                self.show_fix_dialog(code, fix_result, line_num, severity, description)
-                
-                # Close the details dialog if it exists
-                if dialog:
-                    dialog.destroy()
-            else:
-                Messagebox.showerror("AI Not Available", "AI assistant is not available. Please check your API key.")
-                
-        except Exception as e:
-            Messagebox.showerror("Fix Error", f"Error generating fix: {str(e)}")
-            
-        finally:
-            self.status_var.set("Ready")
+        if not (hasattr(self, 'ai_interface') and self.ai_interface):
+            Messagebox.showerror("AI Not Available", "AI assistant is not available. Please check your API key.")
+            return
             
-    def show_fix_dialog(self, original_code, fix_result, line_num, severity, description):
-        """Show dialog with the suggested fix."""
-        fix_dialog = tb.Toplevel(self.root)
-        fix_dialog.title(f"Fix for {severity} Vulnerability")
-        fix_dialog.geometry("800x600")
-        fix_dialog.resizable(True, True)
-        fix_dialog.transient(self.root)
-        fix_dialog.grab_set()
-        
-        # Center the dialog
-        fix_dialog.update_idletasks()
-        width = fix_dialog.winfo_width()
-        height = fix_dialog.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        fix_dialog.geometry(f"{width}x{height}+{x}+{y}")
-        
-        # Create main frame
-        main_frame = tb.Frame(fix_dialog, padding=10)
-        main_frame.pack(fill=BOTH, expand=True)
-        
-        # Header
-        header_text = f"Fix Recommendation for {severity} Vulnerability on Line {line_num}"
-        header_label = tb.Label(main_frame, text=header_text, font=("Helvetica", 12, "bold"))
-        header_label.pack(anchor=tk.W, pady=(0, 5))
-        
-        tb.Label(
-            main_frame,
-            text=description,
-            wraplength=760
-        ).pack(anchor=tk.W, pady=(0, 15))
+        # Set status
+        self.status_var.set("Generating fix recommendation...")
+        prompt = self._build_fix_prompt(code, language, line_num, severity, description)
         
-        # Fix recommendation
-        tb.Label(
-            main_frame,
-            text="AI Fix Recommendation:",
-            font=("Helvetica", 12, "bold")
-        ).pack(anchor=tk.W, pady=(0, 5))
-        
-        # Text widget for fix result
-        fix_text = scrolledtext.ScrolledText(
-            main_frame,
-            wrap=tk.WORD,
-            width=90,
-            height=20,
-            font=("Courier New", 10)
+        # Request the fix on the asyncio loop so the GUI stays responsive
+        task = self._loop.create_task(self._fix_vulnerability_async(prompt))
+        task.add_done_callback(
+            lambda t: self.root.after_idle(self._on_fix_done, t, code, line_num, severity, description, dialog)
         )
-        fix_text.pack(fill=BOTH, expand=True, pady=(0, 15))
-        fix_text.insert(tk.END, fix_result)
-        
-        # Action buttons
-        button_frame = tb.Frame(main_frame)
-        button_frame.pack(fill=tk.X)
         
-        tb.Button(
-            button_frame, 
-            text="Apply Fix",
-            command=lambda: self.apply_fix(fix_result, fix_dialog)
-        ).pack(side=tk.LEFT, padx=(0, 10))
+    def _code_to_fix(self):
+        """Return the (code, language) fixes should be generated from.
+
+        The last completed scan is reused only while the editor still holds
+        the code it scanned, so a fix never rewrites an older version of the
+        buffer and drops the user's later edits.
+        """
+        code = self.scan_text.get(1.0, 'end-1c').strip()
+        if self._completed_scan is not None and self._completed_scan[0] == code:
+            return code, self._completed_scan[1]
+        return code, self.scan_lang
+        
+    def _build_fix_prompt(self, code, language, line_num, severity, description):
+        """Build the AI prompt asking for a fix to one vulnerability."""
+        return f"""I have a {language} code with a {severity.lower()} severity vulnerability on line {line_num}. 
+        The issue is: {description}
+        
+        Here's the code:
+        ```{language.lower()}
+        {code}
+        ```
+        
+        Please provide a fixed version of this specific vulnerability, explaining the security issue and showing the corrected code. 
+        Focus only on fixing this one vulnerability.
+        """
         
-        tb.Button(
-            button_frame, 
-            text="Close",
-            command=fix_dialog.destroy
-        ).pack(side=tk.RIGHT)
+    async def _fix_vulnerability_async(self, prompt):
+        """Ask the AI for a fix without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.ai_interface.ask_question, prompt)
         
-    def apply_fix(self, fix_result, dialog=None):
-        """Apply the suggested fix to the code."""
+    def _on_fix_done(self, future, code, line_num, severity, description, dialog=None):
+        """Show the generated fix, or the error."""
         try:
-            # Extract code blocks from fix result
-            import re
-            code_blocks = re.findall(r'```(?:\w+)?\n(.*?)```', fix_result, re.DOTALL)
+            fix_result = future.result()
             
-            if code_blocks:
-                # Take the last code block as the fixed code
-                fixed_code = code_blocks[-1].strip()
-                
-                # Apply the fix
-                self.scan_text.delete(1.0, 'end')
-                self.scan_text.insert(tk.END, fixed_code)
-                
-                # Close dialog if provided
-                if dialog:
-                    dialog.destroy()
-                    
-                # Scan again to verify fixes
-                self.scan_code_for_vulnerabilities()
+            # Show the fix dialog
+            self.show_fix_dialog(code, fix_result, line_num, severity, description)
+            
+            # Close the details dialog if it exists
+            if dialog:
+                dialog.destroy()
                 
-                Messagebox.showinfo(
-                    "Fix Applied", 
-                    "The fix has been applied to the code. Rescanning to verify."
-                )
-            else:
-                Messagebox.showwarning(
-                    "No Code Found", 
-                    "Could not extract code from the fix result. Please review the recommendation and apply changes manually."
-                )
         except Exception as e:
-            Messagebox.showerror("Error", f"Error applying fix: {str(e)}")
-
+            Messagebox.showerror("Fix Error", f"Error generating fix: {str(e)}")
+            
+        finally:
+            self.status_var.set("Ready")
+            
     def apply_fixes(self):
         """Apply fixes to all vulnerabilities."""
         # Get all vulnerability items
@@ -1347,19 +1472,68 @@ class IntegratedTranslatorGUI:
             Messagebox.showinfo("No Vulnerabilities", "No vulnerabilities to fix.")
             return
             
+        if not (hasattr(self, 'ai_interface') and self.ai_interface):
+            Messagebox.showerror("AI Not Available", "AI assistant is not available. Please check your API key.")
+            return
+            
         # Confirm with user
         result = Messagebox.askyesno(
             "Fix All Vulnerabilities",
-            f"This will attempt to fix all {len(items)} vulnerabilities one by one. Continue?",
+            f"This will attempt to fix all {len(items)} vulnerabilities. Continue?",
             icon=Messagebox.QUESTION
         )
         
         if not result:
             return
             
-        # Fix each vulnerability
+        # Build one prompt per vulnerability
+        code, language = self._code_to_fix()
+        findings = []
+        prompts = []
         for item in items:
-            self.fix_vulnerability(item)
+            values = self.results_tree.item(item, 'values')
+            if not values:
+                continue
+            line_num, severity, category, description = values
+            findings.append(values)
+            prompts.append(self._build_fix_prompt(code, language, line_num, severity, description))
+            
+        # Request all fixes concurrently on the asyncio loop
+        self.status_var.set(f"Generating fixes for {len(prompts)} vulnerabilities...")
+        task = self._loop.create_task(self._apply_fixes_async(prompts))
+        task.add_done_callback(lambda t: self.root.after_idle(self._on_fixes_done, t, code, findings))
+        
+    async def _apply_fixes_async(self, prompts, max_concurrency=4):
+        """Generate fixes for all prompts, limiting concurrent AI requests."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fix_one(prompt):
+            async with semaphore:
+                return await self._fix_vulnerability_async(prompt)
+                
+        return await asyncio.gather(*(fix_one(prompt) for prompt in prompts), return_exceptions=True)
+        
+    def _on_fixes_done(self, future, code, findings):
+        """Show every generated fix and report a single summary."""
+        try:
+            results = future.result()
+            failed = 0
+            for (line_num, severity, category, description), fix_result in zip(findings, results):
+                if isinstance(fix_result, Exception):
+                    logger.error(f"Error generating fix for line {line_num}: {fix_result}")
+                    failed += 1
+                    continue
+                self.show_fix_dialog(code, fix_result, line_num, severity, description)
+                
+            Messagebox.showinfo(
+                "Fixes Generated",
+                f"Generated {len(results) - failed} of {len(results)} fixes."
+            )
+        except Exception as e:
+            Messagebox.showerror("Fix Error", f"Error generating fixes: {str(e)}")
+            
+        finally:
+            self.status_var.set("Ready")
             
     def export_report(self):
         """Export the vulnerability scan report to a file."""
@@ -1388,11 +1562,19 @@ class IntegratedTranslatorGUI:
                 
             # Open the file
             if Messagebox.askyesno("Report Exported", "Report has been exported. Would you like to open it now?"):
-                os.startfile(file_path)
+                self._io_pool.submit(self._open_file, file_path)
                 
         except Exception as e:
             Messagebox.showerror("Export Error", f"Error exporting report: {str(e)}")
             
+    def _open_file(self, file_path):
+        """Open a file with its associated application, off the Tk thread."""
+        try:
+            os.startfile(file_path)
+        except Exception as e:
+            # Also covers platforms without os.startfile (AttributeError)
+            logger.error(f"Failed to open {file_path}: {e}")
+            
     def export_html_report(self, file_path, items):
         """Export report in HTML format."""
         # Get code and language
@@ -1400,7 +1582,7 @@ class IntegratedTranslatorGUI:
         language = self.scan_lang
         
         # Generate report HTML
-        html = """
+        parts = ["""
         <!DOCTYPE html>
         <html>
         <head>
@@ -1435,34 +1617,34 @@ class IntegratedTranslatorGUI:
                     <th>Line</th>
                     <th>Description</th>
                 </tr>
-        """ % (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), language, len(items))
+        """ % (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), language, len(items))]
         
         # Add vulnerability rows
         for item in items:
             values = self.results_tree.item(item, 'values')
             line_num, severity, category, description = values
             
-            html += """
+            parts.append("""
                 <tr>
                     <td class="%s">%s</td>
                     <td>%s</td>
                     <td>%s</td>
                 </tr>
-            """ % (severity.lower(), severity, line_num, description)
+            """ % (severity.lower(), severity, line_num, description))
             
         # Add code section
-        html += """
+        parts.append("""
             </table>
             
             <h2>Source Code</h2>
             <pre><code>%s</code></pre>
         </body>
         </html>
-        """ % (html.escape(code))
+        """ % html_escape(code))
         
         # Write to file
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(html)
+            f.write("".join(parts))
             
     def export_text_report(self, file_path, items):
         """Export report in plain text format."""
@@ -1471,33 +1653,34 @@ class IntegratedTranslatorGUI:
         language = self.scan_lang
         
         # Generate report text
-        text = "Vulnerability Scan Report\n"
-        text += "=" * 30 + "\n\n"
-        text += f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        text += f"Language: {language}\n"
-        text += f"Total Vulnerabilities: {len(items)}\n\n"
-        
-        text += "Vulnerabilities:\n"
-        text += "-" * 30 + "\n"
+        parts = [
+            "Vulnerability Scan Report\n",
+            "=" * 30 + "\n\n",
+            f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Language: {language}\n",
+            f"Total Vulnerabilities: {len(items)}\n\n",
+            "Vulnerabilities:\n",
+            "-" * 30 + "\n",
+        ]
         
         # Add vulnerability rows
         for item in items:
             values = self.results_tree.item(item, 'values')
             line_num, severity, category, description = values
             
-            text += f"Severity: {severity}\n"
-            text += f"Line: {line_num}\n"
-            text += f"Description: {description}\n"
-            text += "-" * 30 + "\n"
+            parts.append(f"Severity: {severity}\n")
+            parts.append(f"Line: {line_num}\n")
+            parts.append(f"Description: {description}\n")
+            parts.append("-" * 30 + "\n")
             
         # Add code section
-        text += "\nSource Code:\n"
-        text += "-" * 30 + "\n"
-        text += code
+        parts.append("\nSource Code:\n")
+        parts.append("-" * 30 + "\n")
+        parts.append(code)
         
         # Write to file
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(text)
+            f.write("".join(parts))
 
     def run_demo_scan(self):
         """Run a demonstration vulnerability scan."""
@@ -1505,7 +1688,7 @@ class IntegratedTranslatorGUI:
         self.load_example_code()
         
         # Then scan it
-        self.scan_code_for_vulnerabilities()
+        self._start_scan()
         
     def show_fix_dialog(self, original_code, fix_result, line_num, severity, description):
         """Show a dialog with the suggested fix."""
@@ -1557,7 +1740,7 @@ class IntegratedTranslatorGUI:
             font=("Courier New", 10)
         )
         fix_text.pack(fill=BOTH, expand=True, pady=(0, 15))
-        fix_text.insert(tk.END, fix_result)
+        _chunked_insert(fix_text, fix_result)
         
         # Action buttons
         button_frame = tb.Frame(main_frame)
@@ -1579,28 +1762,23 @@ class IntegratedTranslatorGUI:
         """Apply the suggested fix to the code."""
         try:
             # Extract code blocks from fix result
-            import re
-            code_blocks = re.findall(r'```(?:\w+)?\n(.*?)```', fix_result, re.DOTALL)
+            code_blocks = _CODE_BLOCK_RE.findall(fix_result)
             
             if code_blocks:
                 # Take the last code block as the fixed code
                 fixed_code = code_blocks[-1].strip()
                 
                 # Apply the fix
-                self.scan_text.delete(1.0, 'end')
-                self.scan_text.insert(tk.END, fixed_code)
+                self._replace_scan_code(fixed_code)
                 
                 # Close dialog if provided
                 if dialog:
                     dialog.destroy()
                     
-                # Scan again to verify fixes
-                self.scan_code_for_vulnerabilities()
+                # Scan the changed lines again once the edit has been drawn
+                self._schedule_rescan()
                 
-                Messagebox.showinfo(
-                    "Fix Applied", 
-                    "The fix has been applied to the code. Rescanning to verify."
-                )
+                self._toast("Fix applied; rescanning the changed lines...")
             else:
                 Messagebox.showwarning(
                     "No Code Found", 
@@ -1609,6 +1787,96 @@ class IntegratedTranslatorGUI:
         except Exception as e:
             Messagebox.showerror("Error", f"Error applying fix: {str(e)}")
 
+    def _schedule_rescan(self):
+        """Queue a rescan for when Tk is idle, coalescing repeated requests."""
+        if self._pending_scan_id is not None:
+            self.root.after_cancel(self._pending_scan_id)
+        self._pending_scan_id = self.root.after_idle(self._rescan_changed_lines)
+
+    def _rescan_changed_lines(self):
+        """Rescan only the hunk that differs from the last completed scan.
+
+        Falls back to a full scan when no scan has completed yet.
+
+        Findings above the hunk are kept as they are, findings below it are
+        shifted by the change in line count, and findings inside it are
+        replaced by the result of scanning the hunk.
+        """
+        self._pending_scan_id = None
+        if self._completed_scan is None:
+            self._start_scan()
+            return
+        original_code, language, completed_findings = self._completed_scan
+        fixed_code = self.scan_text.get(1.0, 'end-1c').strip()
+        old_lines = original_code.split('\n')
+        new_lines = fixed_code.split('\n')
+        shortest = min(len(old_lines), len(new_lines))
+        
+        # Lines shared at the start and end of both versions are unchanged
+        prefix = 0
+        while prefix < shortest and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < shortest - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+            suffix += 1
+        old_end = len(old_lines) - suffix
+        new_end = len(new_lines) - suffix
+        shift = new_end - old_end
+        
+        kept = []
+        for finding in completed_findings:
+            if finding.line_number <= prefix:
+                kept.append(finding)
+            elif finding.line_number > old_end:
+                kept.append(dataclass_replace(finding, line_number=finding.line_number + shift))
+                
+        hunk = '\n'.join(new_lines[prefix:new_end])
+        
+        self._cancel_scan()
+        self.scan_button.configure(text="Cancel Scan", state='normal')
+        self._scan_task = self._loop.create_task(self._scan_hunk(hunk, language, prefix))
+        self._scan_task.add_done_callback(
+            lambda t: self.root.after_idle(self._on_hunk_scan_done, t, kept, fixed_code, language)
+        )
+        
+    async def _scan_hunk(self, hunk, language, offset):
+        """Scan a block of lines, reporting findings at their position in the file.
+
+        Findings without a line number (line 0, as reported by Gemini) are
+        returned unchanged.
+        """
+        if not hunk.strip():
+            return []
+        scanner = await self._ensure_scanner()
+        return [
+            dataclass_replace(finding, line_number=finding.line_number + offset)
+            if finding.line_number > 0 else finding
+            async for finding in scanner.scan_code_stream(hunk, language)
+        ]
+        
+    def _on_hunk_scan_done(self, future, kept, fixed_code, language):
+        """Merge the rescanned hunk into the kept findings and redraw the results."""
+        if future is not self._scan_task:
+            return
+        self._scan_task = None
+        try:
+            findings = sorted(kept + future.result(), key=lambda finding: finding.line_number)
+            self._last_scanned_code = fixed_code
+            self._scan_findings = findings
+            self._completed_scan = (fixed_code, language, list(findings))
+            parts = [self._format_finding(finding) for finding in findings]
+            if findings:
+                parts.append(f"\nScan complete: {len(findings)} vulnerabilities found.\n")
+            else:
+                parts.append("No vulnerabilities found or scanner returned empty.\n")
+            self._set_scan_results("".join(parts))
+        except asyncio.CancelledError:
+            self._append_scan_results("\nScan cancelled.\n")
+        except Exception as e:
+            self._show_error(f"Error scanning code: {str(e)}")
+        finally:
+            self.scan_button.configure(text="Scan Code", state='normal')
+
     def initialize_ai(self):
         """Initialize the AI translator with the current settings."""
         try:
@@ -1795,10 +2063,19 @@ class IntegratedTranslatorGUI:
         scale_label = tb.Label(scale_frame, text="100%")
         scale_label.pack(side=tk.LEFT, padx=5)
         
-        # Update label when scale changes
-        def update_scale_label(*args):
+        # Update label when scale changes, once per idle pass while dragging
+        pending = None
+        
+        def flush_scale_label():
+            nonlocal pending
+            pending = None
             scale_label.config(text=f"{int(self.ui_scale_var.get() * 100)}%")
         
+        def update_scale_label(*args):
+            nonlocal pending
+            if pending is None:
+                pending = scale_label.after_idle(flush_scale_label)
+        
         self.ui_scale_var.trace("w", update_scale_label)
         
     def _setup_editor_tab(self, parent):
@@ -1854,10 +2131,9 @@ class IntegratedTranslatorGUI:
         ).pack(side=tk.LEFT, padx=10)
         
         self.highlight_style_var = tb.StringVar(value="monokai")
-        styles = ["default", "monokai", "vs", "solarized-dark", "solarized-light"]
         style_combo = tb.Combobox(
             style_frame,
-            values=styles,
+            values=_HIGHLIGHT_STYLES,
             textvariable=self.highlight_style_var,
             width=15,
             state="readonly"
@@ -1904,11 +2180,15 @@ class IntegratedTranslatorGUI:
         
         # Show/Hide password
         self.show_api_key_var = tb.BooleanVar(value=False)
+        
+        def toggle_api_key_shown():
+            api_key_entry.config(show=_API_KEY_MASK[self.show_api_key_var.get()])
+        
         tb.Checkbutton(
             content_frame,
             text="Show",
             variable=self.show_api_key_var,
-            command=lambda: api_key_entry.config(show="" if self.show_api_key_var.get() else "*")
+            command=toggle_api_key_shown
         ).pack(pady=(0, 10))
         
         # Model selection
@@ -1921,10 +2201,9 @@ class IntegratedTranslatorGUI:
         ).pack(side=tk.LEFT, padx=10)
         
         self.model_var = tb.StringVar(value=self.gemini_model)
-        models = ["models/gemini-1.5-pro-001"]
         model_combo = tb.Combobox(
             model_frame,
-            values=models,
+            values=_GEMINI_MODELS,
             textvariable=self.model_var,
             width=15,
             state="readonly"
@@ -1965,22 +2244,10 @@ class IntegratedTranslatorGUI:
             
         try:
             self.status_var.set("Testing API connection...")
-            # Try to initialize a temporary Gemini interface
-            from ai_code_translator.gemini_interface import GeminiInterface
-            temp_gemini = GeminiInterface(
-                api_key=api_key,
-                model=self.model_var.get()
-            )
-            
-            # Test the model by sending a simple request
-            test_prompt = "Hello, how are you?"
-            response = temp_gemini.generate(test_prompt)
-            
-            if response:
-                Messagebox.showinfo("Success", "API connection successful!")
-                self.status_var.set("API: Connected")
-            else:
-                raise Exception("No response from API")
+            # Test the key and model with a simple request, reusing a recent success
+            _probe_api(api_key, self.model_var.get())
+            Messagebox.showinfo("Success", "API connection successful!")
+            self.status_var.set("API: Connected")
                 
         except Exception as e:
             logger.error(f"API test failed: {str(e)}")
@@ -2001,24 +2268,20 @@ class IntegratedTranslatorGUI:
             delta = new_font_size - self.font_size
             self._change_font_size(delta)
             
-        # Apply API settings
+        # Apply API and model settings, re-initializing the AI at most once
         new_api_key = self.api_key_var.get()
-        if new_api_key != self.gemini_api_key:
-            self.gemini_api_key = new_api_key
-            self._initialize_ai_components()
-            self.api_status.config(text="API: Connected" if self.gemini_api_key else "API: Not Connected")
-            
-        # Apply model settings
         new_model = self.model_var.get()
-        if new_model != self.gemini_model:
-            self.gemini_model = new_model
+        need_reinit = new_api_key != self.gemini_api_key or new_model != self.gemini_model
+        self.gemini_api_key = new_api_key
+        self.gemini_model = new_model
+        if need_reinit:
+            _probe_successes.clear()
             self._initialize_ai_components()
-            self.model_indicator.config(text=f"Model: {new_model}")
+        self.api_status.config(text="API: Connected" if self.gemini_api_key else "API: Not Connected")
+        self.model_indicator.config(text=f"Model: {new_model}")
             
         # Apply word wrap
-        wrap_mode = tk.WORD if self.word_wrap_var.get() else tk.NONE
-        self.source_text.configure(wrap=wrap_mode)
-        self.target_text.configure(wrap=wrap_mode)
+        self._set_wrap_mode(tk.WORD if self.word_wrap_var.get() else tk.NONE)
         
         # Save settings
         self._save_settings()
@@ -2039,72 +2302,76 @@ class IntegratedTranslatorGUI:
             "ui_scale": self.ui_scale_var.get()
         }
         
-        config_dir = Path(__file__).parent / "config"
-        config_dir.mkdir(exist_ok=True)
-        
         try:
-            with open(config_dir / "settings.json", "w") as f:
-                json.dump(config, f, indent=4)
+            _CONFIG_DIR.mkdir(exist_ok=True)
+            _SETTINGS_PATH.write_bytes(_dumps(config))
         except Exception as e:
             logger.error(f"Failed to save settings: {e}")
 
     def _load_settings(self):
-        """Load settings from a configuration file."""
-        config_path = Path(__file__).parent / "config" / "settings.json"
-        
+        """Load settings from a configuration file without blocking the UI."""
+        future = self._loop.run_in_executor(self._io_pool, self._read_settings_file)
+        future.add_done_callback(lambda f: self.root.after_idle(self._apply_loaded_settings, f))
+
+    def _read_settings_file(self):
+        """Read and parse the settings file on the I/O pool, or return None if there is none."""
+        if not _SETTINGS_PATH.exists():
+            return None
+        return _loads(_SETTINGS_PATH.read_bytes())
+
+    def _load_theme_setting(self, value):
+        """Apply a saved theme."""
+        self.current_theme = value
+        self.theme_var.set(value)
+        self.style.theme_use(THEMES[value])
+        self._theme_cursor = self._theme_positions.get(THEMES[value], self._theme_cursor)
+
+    def _load_word_wrap_setting(self, value):
+        """Apply a saved word wrap preference to the editors."""
+        self._set_wrap_mode(tk.WORD if value else tk.NONE)
+        self.word_wrap_var.set(value)
+
+    def _set_wrap_mode(self, wrap_mode):
+        """Set the editors' wrap mode, skipping the relayout if it is unchanged."""
+        if wrap_mode == self._current_wrap_mode:
+            return
+        self.source_text.configure(wrap=wrap_mode)
+        self.target_text.configure(wrap=wrap_mode)
+        self._current_wrap_mode = wrap_mode
+
+    # Settings file key -> function applying its value
+    _SETTING_APPLIERS = {
+        "theme": _load_theme_setting,
+        "font_size": lambda self, value: setattr(self, "font_size", value),
+        "model": lambda self, value: setattr(self, "gemini_model", value),
+        "word_wrap": _load_word_wrap_setting,
+        "line_numbers": lambda self, value: self.line_numbers_var.set(value),
+        "syntax_highlight": lambda self, value: self.syntax_highlight_var.set(value),
+        "highlight_style": lambda self, value: self.highlight_style_var.set(value),
+        "auto_indent": lambda self, value: self.auto_indent_var.set(value),
+        "ui_scale": lambda self, value: self.ui_scale_var.set(value),
+    }
+
+    def _apply_loaded_settings(self, future):
+        """Apply the settings read on the I/O pool to the widgets on the Tk thread."""
         try:
-            if config_path.exists():
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    
-                # Apply settings
-                if "theme" in config:
-                    self.current_theme = config["theme"]
-                    self.theme_var.set(self.current_theme)
-                    self.style.theme_use(THEMES[self.current_theme])
-                    
-                if "font_size" in config:
-                    self.font_size = config["font_size"]
-                    
-                if "model" in config:
-                    self.gemini_model = config["model"]
-                    
-                if "word_wrap" in config:
-                    wrap_mode = tk.WORD if config["word_wrap"] else tk.NONE
-                    self.source_text.configure(wrap=wrap_mode)
-                    self.target_text.configure(wrap=wrap_mode)
-                    self.word_wrap_var.set(config["word_wrap"])
-                    
-                if "line_numbers" in config:
-                    self.line_numbers_var.set(config["line_numbers"])
-                    
-                if "syntax_highlight" in config:
-                    self.syntax_highlight_var.set(config["syntax_highlight"])
-                    
-                if "highlight_style" in config:
-                    self.highlight_style_var.set(config["highlight_style"])
-                    
-                if "auto_indent" in config:
-                    self.auto_indent_var.set(config["auto_indent"])
-                    
-                if "ui_scale" in config:
-                    self.ui_scale_var.set(config["ui_scale"])
+            config = future.result()
+            if config is None:
+                return
+            for key, value in config.items():
+                applier = self._SETTING_APPLIERS.get(key)
+                if applier:
+                    applier(self, value)
                     
-                logger.info("Settings loaded successfully")
+            logger.info("Settings loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
 
     def _change_theme(self):
         """Change the application theme."""
-        # Get current theme
-        current_theme = self.style.theme_use()
-        
-        # Get all available themes
-        themes = self.style.theme_names()
-        
-        # Find the next theme in the list
-        theme_index = themes.index(current_theme)
-        next_theme = themes[(theme_index + 1) % len(themes)]
+        # Advance to the next theme in the cycle
+        self._theme_cursor = (self._theme_cursor + 1) % len(self._theme_cycle)
+        next_theme = self._theme_cycle[self._theme_cursor]
         
         # Apply new theme
         self.style.theme_use(next_theme)
@@ -2121,7 +2388,7 @@ class IntegratedTranslatorGUI:
         status_label.pack(side=LEFT, padx=5, pady=2)
 
         # Theme indicator
-        self.theme_indicator = tb.Label(status_frame, text=f"Theme: {self.style.theme_use()}")
+        self.theme_indicator = tb.Label(status_frame, text=f"Theme: {self._theme_cycle[self._theme_cursor]}")
         self.theme_indicator.pack(side=LEFT, padx=5, pady=2)
 
         # API status
@@ -2154,7 +2421,6 @@ class IntegratedTranslatorGUI:
         about_dialog = tk.Toplevel(self.root)
         about_dialog.title("About AI Code Translator")
         about_dialog.transient(self.root)
-        about_dialog.grab_set()
         
         # Center the dialog
         about_dialog.update_idletasks()
@@ -2181,9 +2447,6 @@ class IntegratedTranslatorGUI:
             command=about_dialog.destroy
         )
         close_button.pack(pady=10)
-        
-        # Make dialog modal
-        about_dialog.wait_window()
 
 def main():
     """Run the integrated translator GUI."""
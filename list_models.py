@@ -1,5 +1,4 @@
 import os
-import google.generativeai as genai
 
 def main():
     api_key = os.environ.get("GEMINI_API_KEY")
@@ -7,6 +6,7 @@ def main():
         print("Please set the GEMINI_API_KEY environment variable")
         return
     
+    import google.generativeai as genai
     genai.configure(api_key=api_key)
     
     print("Available models:")
@@ -3,10 +3,12 @@ Core Vulnerability Scanner for AI Code Translator
 Premium Feature for Advanced Version
 """
 
+import asyncio
 import os
 import logging
 import json
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from .premium_manager import PremiumManager
@@ -21,6 +23,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Lines scanned between suspensions of scan_code_stream, so an event loop
+# driven from a GUI gets control back while a long file is scanned
+_LINES_PER_YIELD = 200
+
 class VulnerabilitySeverity(Enum):
     """Severity levels for vulnerabilities"""
     CRITICAL = "CRITICAL"
@@ -83,6 +89,7 @@ class VulnerabilityScanner:
         
         # Load vulnerability patterns
         self.patterns = self._load_vulnerability_patterns()
+        self._compiled_patterns = self._compile_patterns(self.patterns)
         
     def _load_vulnerability_patterns(self) -> Dict:
         """Load vulnerability patterns from pattern files"""
@@ -138,22 +145,25 @@ class VulnerabilityScanner:
             logger.error(f"Error loading vulnerability patterns: {str(e)}")
             return {}
 
-    def _matches_pattern(self, line: str, pattern: str) -> bool:
-        """Check if a line matches a vulnerability pattern"""
-        import re
-        try:
-            if not line.strip() or not pattern.strip():
-                return False
-                
-            logger.debug(f"Checking line: {line.strip()}")
-            logger.debug(f"Against pattern: {pattern}")
-            match = bool(re.search(pattern, line, re.IGNORECASE))
-            if match:
-                logger.info(f"Match found! Line: {line.strip()}")
-            return match
-        except Exception as e:
-            logger.error(f"Error matching pattern '{pattern}': {str(e)}")
-            return False
+    def _compile_patterns(self, patterns: Dict) -> Dict[str, List[Tuple[str, Dict, re.Pattern]]]:
+        """Compile every language's patterns into a flat list of (category, data, regex) rules
+        
+        Blank and invalid patterns are skipped, so the scan loop only has to
+        walk one list per line.
+        """
+        compiled = {}
+        for lang, categories in patterns.items():
+            rules = []
+            for category, data in categories.items():
+                for pattern in data['patterns']:
+                    if not pattern.strip():
+                        continue
+                    try:
+                        rules.append((category, data, re.compile(pattern, re.IGNORECASE)))
+                    except re.error as e:
+                        logger.error(f"Error compiling pattern '{pattern}': {str(e)}")
+            compiled[lang] = rules
+        return compiled
 
     async def scan_code(self, code: str, language: str) -> List[Vulnerability]:
         """Scan code for vulnerabilities using pattern matching and Gemini
@@ -165,6 +175,23 @@ class VulnerabilityScanner:
         Returns:
             List of detected vulnerabilities
         """
+        async for _ in self.scan_code_stream(code, language):
+            pass
+        return self.vulnerabilities
+
+    async def scan_code_stream(self, code: str, language: str) -> AsyncIterator[Vulnerability]:
+        """Scan code for vulnerabilities, yielding each one as it is found
+        
+        The scan suspends between batches of lines, so a consumer running on
+        the same event loop can show findings while the scan continues.
+        
+        Args:
+            code: Source code to scan
+            language: Programming language of the code
+            
+        Yields:
+            Detected vulnerabilities, in detection order
+        """
         logger.info(f"Starting code scan for language: {language}")
         self.vulnerabilities = []
         
@@ -176,30 +203,38 @@ class VulnerabilityScanner:
         
         if language_lower not in self.patterns:
             logger.warning(f"No patterns found for language: {language} (lowercase: {language_lower})")
-            return self.vulnerabilities
+            return
             
         logger.info(f"Found {len(self.patterns[language_lower])} pattern categories for {language_lower}")
         lines = code.split('\n')
+        rules = self._compiled_patterns[language_lower]
         
         # Pattern-based scanning
         for i, line in enumerate(lines, 1):
-            for category, data in self.patterns[language_lower].items():
-                for pattern in data['patterns']:
-                    if self._matches_pattern(line, pattern):
-                        logger.info(f"Found {category} vulnerability on line {i}")
-                        fix = await self._get_fix_suggestion(category, line)
-                        self.vulnerabilities.append(Vulnerability(
-                            line_number=i,
-                            category=category,
-                            description=data.get('description', 'Unknown vulnerability'),
-                            severity=VulnerabilitySeverity[data.get('severity', 'HIGH')],
-                            code_snippet=line.strip(),
-                            fix_suggestion=fix
-                        ))
+            if i % _LINES_PER_YIELD == 0:
+                await asyncio.sleep(0)
+            if not line.strip():
+                continue
+            for category, data, pattern in rules:
+                if pattern.search(line):
+                    logger.info(f"Found {category} vulnerability on line {i}")
+                    fix = await self._get_fix_suggestion(category, line)
+                    vulnerability = Vulnerability(
+                        line_number=i,
+                        category=category,
+                        description=data.get('description', 'Unknown vulnerability'),
+                        severity=VulnerabilitySeverity[data.get('severity', 'HIGH')],
+                        code_snippet=line.strip(),
+                        fix_suggestion=fix
+                    )
+                    self.vulnerabilities.append(vulnerability)
+                    yield vulnerability
         
         # Gemini-enhanced scanning for premium users
         if self.is_premium and self.gemini:
             logger.info("Starting Gemini-enhanced scanning")
+            # Let the last batch of pattern findings be drawn before the request
+            await asyncio.sleep(0)
             try:
                 gemini_results = await self._analyze_with_gemini(code, language)
                 for vuln_type, description, confidence in gemini_results:
@@ -207,7 +242,7 @@ class VulnerabilityScanner:
                     if not any(v.category == vuln_type for v in self.vulnerabilities):
                         logger.info(f"Gemini found new vulnerability type: {vuln_type}")
                         fix = await self._get_fix_suggestion(vuln_type, code)
-                        self.vulnerabilities.append(Vulnerability(
+                        vulnerability = Vulnerability(
                             line_number=0,  # Gemini might not provide line numbers
                             category=vuln_type,
                             description=description,
@@ -215,12 +250,13 @@ class VulnerabilityScanner:
                             code_snippet=code,  # Include full code for context
                             fix_suggestion=fix,
                             confidence=confidence
-                        ))
+                        )
+                        self.vulnerabilities.append(vulnerability)
+                        yield vulnerability
             except Exception as e:
                 logger.error(f"Error during Gemini scanning: {str(e)}")
         
         logger.info(f"Scan complete. Found {len(self.vulnerabilities)} vulnerabilities")
-        return self.vulnerabilities
 
     async def _get_fix_suggestion(self, category: str, code: str) -> str:
         """Get fix suggestion for a vulnerability using Gemini if available"""
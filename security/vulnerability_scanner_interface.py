@@ -2,7 +2,7 @@
 Interface for vulnerability scanning functionality.
 """
 
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any
 from security.vulnerability_scanner import VulnerabilityScanner
 
 class VulnerabilityScannerInterface:
@@ -33,6 +33,21 @@ class VulnerabilityScannerInterface:
             raise ValueError("Vulnerability scanner not initialized")
         return self.scanner.scan_code(code, language)
         
+    def scan_code_stream(self, code: str, language: str) -> AsyncIterator[Any]:
+        """
+        Scan code for vulnerabilities, yielding findings as they are detected.
+        
+        Args:
+            code: The code to scan
+            language: The programming language of the code
+            
+        Returns:
+            Async iterator over vulnerability findings
+        """
+        if not self.scanner:
+            raise ValueError("Vulnerability scanner not initialized")
+        return self.scanner.scan_code_stream(code, language)
+        
     def get_vulnerability_patterns(self, language: str) -> List[Dict[str, Any]]:
         """
         Get vulnerability patterns for a specific language.
@@ -6,11 +6,6 @@ import os
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 def test_api():
@@ -26,12 +21,12 @@ def test_api():
             # Test translation
             logger.info("Testing code translation...")
             result = ai.translate_code("print('Hello World')", "javascript")
-            logger.info(f"Translation result: {result}")
+            logger.info("Translation result: %s", result)
             
             # Test chat
             logger.info("Testing chat functionality...")
             response = ai.chat("What is the purpose of this AI Code Translator?")
-            logger.info(f"Chat response: {response}")
+            logger.info("Chat response: %s", response)
             
             logger.info("All tests completed successfully!")
             return True
@@ -39,8 +34,13 @@ def test_api():
             logger.error("API connection failed")
             return False
     except Exception as e:
-        logger.error(f"Error during API test: {str(e)}")
+        logger.error("Error during API test: %s", e)
         return False
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     test_api()